@@ -29,6 +29,10 @@ from orchestrator.agents.github_sync_agent import GitHubSyncAgent
 class IndependentOrchestrator:
     """Orchestrateur complètement indépendant qui s'auto-évolue en permanence"""
     
+    # Répertoire de logs, créé une seule fois par processus
+    log_dir = Path("logs")
+    _logdir_created = False
+    
     def __init__(self):
         self.config = self._load_config()
         self.orchestrator = AutonomousOrchestrator(self.config)
@@ -72,10 +76,17 @@ class IndependentOrchestrator:
         
         return config
     
+    @classmethod
+    def _ensure_logdir(cls) -> Path:
+        """Créer le répertoire de logs si ce n'est pas déjà fait"""
+        if not cls._logdir_created:
+            cls.log_dir.mkdir(parents=True, exist_ok=True)
+            cls._logdir_created = True
+        return cls.log_dir
+    
     def setup_logging(self):
         """Configurer le logging pour l'orchestration autonome"""
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
+        log_dir = self._ensure_logdir()
         
         logging.basicConfig(
             level=logging.INFO,
@@ -6,7 +6,7 @@ Coeur du système d'auto-génération et d'amélioration continue
 import asyncio
 import os
 import sys
-import subprocess
+from subprocess import run as subprocess_run
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import json
@@ -222,7 +222,7 @@ class SelfEvolutionAgent:
         """Configurer la sandbox pour le développement"""
         if not self.sandbox_path.exists():
             # Cloner le repo principal dans la sandbox
-            subprocess.run([
+            subprocess_run([
                 "git", "clone", 
                 str(self.main_repo_path), 
                 str(self.sandbox_path)
@@ -230,15 +230,15 @@ class SelfEvolutionAgent:
         else:
             # Nettoyer et synchroniser avec le principal
             os.chdir(self.sandbox_path)
-            subprocess.run(["git", "fetch", "origin"], check=True)
-            subprocess.run(["git", "reset", "--hard", "origin/main"], check=True)
+            subprocess_run(["git", "fetch", "origin"], check=True)
+            subprocess_run(["git", "reset", "--hard", "origin/main"], check=True)
             os.chdir(self.main_repo_path)
     
     async def rollback_sandbox(self):
         """Annuler les modifications dans la sandbox"""
         if self.sandbox_path.exists():
             os.chdir(self.sandbox_path)
-            subprocess.run(["git", "reset", "--hard"], check=True)
+            subprocess_run(["git", "reset", "--hard"], check=True)
             os.chdir(self.main_repo_path)
     
     async def _analyze_logs(self) -> List[str]:
@@ -308,17 +308,17 @@ class SelfEvolutionAgent:
         
         return gaps
     
-    async def _get_modified_files(self) -> List[Path]:
-        """Obtenir la liste des fichiers modifiés dans la sandbox"""
+    async def _get_modified_files(self) -> List[str]:
+        """Obtenir la liste des fichiers modifiés dans la sandbox (chemins relatifs)"""
         os.chdir(self.sandbox_path)
-        result = subprocess.run(
+        result = subprocess_run(
             ["git", "diff", "--name-only"],
             capture_output=True,
             text=True
         )
         os.chdir(self.main_repo_path)
         
-        return [Path(f) for f in result.stdout.strip().split("\n") if f]
+        return [f for f in result.stdout.strip().split("\n") if f]
     
     async def _write_to_sandbox(self, code: Dict[str, str]):
         """Écrire le code généré dans la sandbox"""
@@ -330,13 +330,13 @@ class SelfEvolutionAgent:
     async def _git_commit_and_push(self):
         """Commit et push les modifications"""
         try:
-            subprocess.run(["git", "add", "."], check=True)
-            subprocess.run([
+            subprocess_run(["git", "add", "."], check=True)
+            subprocess_run([
                 "git", "commit", "-m", 
                 f"[AUTO-EVOLUTION] Cycle {self.evolution_cycle} - Auto-amélioration"
             ], check=True)
             # Note: Le push réel nécessiterait une configuration Git appropriée
-            # subprocess.run(["git", "push"], check=True)
+            # subprocess_run(["git", "push"], check=True)
         except Exception as e:
             print(f"[EVOLUTION] Git commit: {e}")
     
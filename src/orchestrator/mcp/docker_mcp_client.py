@@ -9,15 +9,8 @@ import asyncio
 import json
 import logging
 from typing import Dict, List, Any, Optional
-# import docker
-# from docker.errors import NotFound, APIError
-
-# Mock Docker classes for tests
-class NotFound(Exception):
-    pass
-
-class APIError(Exception):
-    pass
+import docker
+from docker.errors import NotFound, APIError
 
 from .mcp_interface import (
     MCPInterface, MCPError, MCPConnectionError, MCPToolError, MCPResourceError,
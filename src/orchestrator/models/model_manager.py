@@ -33,6 +33,9 @@ class Model:
 class ModelManager:
     """Gestionnaire des modèles AI - respecte SOLID SRP"""
     
+    REQUIRED_MODEL_FIELDS = ("name", "type")
+    SUPPORTED_MODEL_TYPES = frozenset({"docker", "lm_studio"})
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.active_models: List[Dict[str, Any]] = []
@@ -226,15 +229,10 @@ class ModelManager:
     
     def validate_model_config(self, config: Dict[str, Any]) -> bool:
         """Valider la configuration d'un modèle"""
-        required_fields = ["name", "type"]
-        for field in required_fields:
-            if field not in config:
-                return False
-        
-        if config["type"] not in ["docker", "lm_studio"]:
+        if not all(name in config for name in self.REQUIRED_MODEL_FIELDS):
             return False
         
-        return True
+        return config["type"] in self.SUPPORTED_MODEL_TYPES
     
     def get_client(self):
         """Obtenir un client AI (mock pour les tests)"""
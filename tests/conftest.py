@@ -4,6 +4,8 @@ Configuration des fixtures pytest pour tous les tests
 
 import pytest
 import asyncio
+import copy
+import importlib.util
 import tempfile
 import shutil
 from pathlib import Path
@@ -17,27 +19,147 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 # Import pour éviter l'erreur de package
 import orchestrator
 
+# uvloop optionnel (non disponible sous Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+_REPO_ROOT = str(Path(__file__).parent.parent)
+
+# Valeurs de retour par défaut des doubles partagés, restaurées avant chaque test
+_AI_CLIENT_DEFAULTS = {
+    "generate_response": "Generated response",
+    "test_connection": True,
+}
+_MCP_SERVER_DEFAULTS = {
+    "connect": True,
+    "send_message": {"status": "ok"},
+}
+_DOCKER_CLIENT_DEFAULTS = {
+    "containers.list": [],
+}
+_LM_STUDIO_CLIENT_DEFAULTS = {
+    "connect": True,
+    "generate": "LM Studio response",
+    "list_models": ["model1", "model2"],
+    "health_check": {"status": "healthy", "models_available": 2},
+}
+
+
+def _register_root_autonomous():
+    """Exposer orchestrator/autonomous.py (racine) sous orchestrator.autonomous
+
+    Le package "orchestrator" résout vers src/ : le point d'entrée autonome
+    de la racine est chargé par chemin puis enregistré dans sys.modules.
+    """
+    if "orchestrator.autonomous" in sys.modules:
+        return
+    autonomous_path = Path(_REPO_ROOT) / "orchestrator" / "autonomous.py"
+    try:
+        spec = importlib.util.spec_from_file_location("orchestrator.autonomous", autonomous_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except Exception:
+        # Toute erreur d'import (y compris SyntaxError) ne doit pas interrompre
+        # la session : les modules dépendants sont alors ignorés ou en échec
+        return
+    sys.modules["orchestrator.autonomous"] = module
+    orchestrator.autonomous = module
+
+
+def _restore_mock(mock, defaults):
+    """Effacer l'historique d'un mock partagé et restaurer ses retours par défaut"""
+    mock.reset_mock()
+    mock.side_effect = None
+    for path, value in defaults.items():
+        child = mock
+        for name in path.split("."):
+            child = getattr(child, name)
+        child.side_effect = None
+        child.return_value = copy.deepcopy(value)
+    return mock
+
+
+def pytest_configure(config):
+    """Rendre la racine du dépôt importable une seule fois par session"""
+    if _REPO_ROOT not in sys.path:
+        sys.path.append(_REPO_ROOT)
+    _register_root_autonomous()
+
+
+def pytest_addoption(parser):
+    """Options de ligne de commande spécifiques au projet"""
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="Exécuter aussi les tests marqués slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Ignorer les tests slow sauf si --runslow est fourni"""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="nécessite --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Fabrique de boucle : uvloop si installé, asyncio standard sinon"""
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_subprocess():
+    """Empêcher tout appel subprocess réel (git...) pendant la session de tests"""
+    with patch("subprocess.run", return_value=Mock(returncode=0, stdout="", stderr="")):
+        yield
+
 
 @pytest.fixture
-def event_loop():
-    """Créer une boucle d'événements pour les tests async"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def no_git():
+    """Neutraliser les commandes git lancées par SelfEvolutionAgent (subprocess_run)"""
+    completed = Mock(returncode=0, stdout="", stderr="")
+    with patch("orchestrator.agents.self_evolution_agent.subprocess_run", return_value=completed) as mock:
+        yield mock
+
+
+@pytest.fixture(scope="session")
+def shared_tmp():
+    """Répertoire temporaire racine partagé par toute la session"""
+    root = Path(tempfile.mkdtemp())
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
 
 
 @pytest.fixture
-def temp_dir():
-    """Créer un répertoire temporaire pour les tests"""
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    shutil.rmtree(temp_path)
+def temp_dir(shared_tmp):
+    """Créer un sous-répertoire temporaire isolé pour chaque test"""
+    yield Path(tempfile.mkdtemp(dir=shared_tmp))
 
 
 @pytest.fixture
-def mock_config():
-    """Configuration mock pour les tests"""
-    return {
+def no_sleep(monkeypatch):
+    """Neutraliser asyncio.sleep pour les tests de retry et de reconnexion"""
+    mock = AsyncMock()
+    monkeypatch.setattr(asyncio, "sleep", mock)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def make_config():
+    """Fabrique de configurations mock : une copie profonde indépendante par appel
+
+    Les agents modifient parfois leur config (objectifs auto-définis,
+    sous-dictionnaires) : chaque consommateur reçoit donc sa propre copie.
+    """
+    template = {
         "project": {
             "name": "test-project",
             "type": "python",
@@ -76,15 +198,25 @@ def mock_config():
             "mcp_port": "64342"
         }
     }
+    return lambda: copy.deepcopy(template)
+
+
+@pytest.fixture
+def mock_config(make_config):
+    """Configuration mock pour les tests"""
+    return make_config()
+
+
+@pytest.fixture(scope="session")
+def _shared_ai_client():
+    """Client AI mocké construit une seule fois par session"""
+    return AsyncMock()
 
 
 @pytest.fixture
-def mock_ai_client():
+def mock_ai_client(_shared_ai_client):
     """Client AI mocké pour les tests"""
-    client = AsyncMock()
-    client.generate_response = AsyncMock(return_value="Generated response")
-    client.test_connection = AsyncMock(return_value=True)
-    return client
+    return _restore_mock(_shared_ai_client, _AI_CLIENT_DEFAULTS)
 
 
 @pytest.fixture
@@ -97,14 +229,16 @@ def mock_github_client():
     return client
 
 
+@pytest.fixture(scope="session")
+def _shared_mcp_server():
+    """Serveur MCP mocké construit une seule fois par session"""
+    return AsyncMock()
+
+
 @pytest.fixture
-def mock_mcp_server():
+def mock_mcp_server(_shared_mcp_server):
     """Serveur MCP mocké pour les tests"""
-    server = AsyncMock()
-    server.connect = AsyncMock(return_value=True)
-    server.send_message = AsyncMock(return_value={"status": "ok"})
-    server.disconnect = AsyncMock()
-    return server
+    return _restore_mock(_shared_mcp_server, _MCP_SERVER_DEFAULTS)
 
 
 @pytest.fixture
@@ -117,22 +251,25 @@ def config_file(temp_dir, mock_config):
     return str(config_path)
 
 
+@pytest.fixture(scope="session")
+def _shared_docker_client():
+    """Client Docker mocké construit une seule fois par session"""
+    return Mock()
+
+
 @pytest.fixture
-def mock_docker_client():
+def mock_docker_client(_shared_docker_client):
     """Client Docker mocké pour les tests"""
-    client = Mock()
-    client.containers = Mock()
-    client.containers.list = Mock(return_value=[])
-    client.containers.run = Mock()
-    return client
+    return _restore_mock(_shared_docker_client, _DOCKER_CLIENT_DEFAULTS)
+
+
+@pytest.fixture(scope="session")
+def _shared_lm_studio_client():
+    """Client LM Studio mocké construit une seule fois par session"""
+    return AsyncMock()
 
 
 @pytest.fixture
-def mock_lm_studio_client():
+def mock_lm_studio_client(_shared_lm_studio_client):
     """Client LM Studio mocké pour les tests"""
-    client = AsyncMock()
-    client.connect = AsyncMock(return_value=True)
-    client.generate = AsyncMock(return_value="LM Studio response")
-    client.list_models = AsyncMock(return_value=["model1", "model2"])
-    client.health_check = AsyncMock(return_value={"status": "healthy", "models_available": 2})
-    return client
\ No newline at end of file
+    return _restore_mock(_shared_lm_studio_client, _LM_STUDIO_CLIENT_DEFAULTS)
\ No newline at end of file
@@ -297,6 +297,7 @@ class TestAutoGeneration:
             assert "assert" in test_code
 
 
+@pytest.mark.usefixtures("no_git")
 class TestSelfEvolution:
     """Tests pour l'auto-évolution"""
     
@@ -346,7 +347,7 @@ class TestSelfEvolution:
         agent.sandbox_path = temp_dir / "sandbox"
         
         # WHEN on configure la sandbox
-        with patch('subprocess.run') as mock_subprocess:
+        with patch('orchestrator.agents.self_evolution_agent.subprocess_run') as mock_subprocess:
             mock_subprocess.return_value = Mock(returncode=0)
             await agent._setup_sandbox()
         
@@ -5,11 +5,82 @@ Phase RED : Ces tests définissent l'auto-génération complètement autonome
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, patch, mock_open
 from pathlib import Path
 import json
-import tempfile
-import shutil
+import re
+from contextlib import ExitStack
+from types import SimpleNamespace
+
+from orchestrator.agents.self_evolution_agent import SelfEvolutionAgent
+from orchestrator.agents.code_generator_agent import CodeGeneratorAgent
+from orchestrator.agents.test_runner_agent import TestRunnerAgent
+from orchestrator.agents.meta_cognitive_agent import MetaCognitiveAgent
+from orchestrator.agents.autonomous_orchestrator import AutonomousOrchestrator
+
+# Les opérations Git de SelfEvolutionAgent sont neutralisées pour tout le module
+pytestmark = pytest.mark.usefixtures("no_git")
+
+
+# Exigences, composants et scénarios couverts par la suite d'indépendance
+_INDEPENDENCE_REQUIREMENTS = (
+    "autonomous_improvement_detection",
+    "autonomous_code_generation",
+    "autonomous_testing_validation",
+    "autonomous_deployment_decision",
+    "autonomous_quality_assurance",
+    "zero_human_intervention_workflow",
+    "autonomous_goal_definition"
+)
+
+_CRITICAL_COMPONENTS = (
+    "autonomous_orchestrator",
+    "meta_cognitive_agent",
+    "self_evolution_agent",
+    "code_generator_agent",
+    "test_runner_agent"
+)
+
+_INTEGRATION_SCENARIOS = (
+    "zero_human_intervention_workflow",
+    "autonomous_continuous_improvement",
+    "self_modification_autonomy",
+    "independent_goal_definition"
+)
+
+# Termes recherchés par les méta-tests TDD, compilés en une seule alternance
+_INDEPENDENCE_RE = re.compile(r"autonomous|independent|auto")
+_INTEGRATION_RE = re.compile(r"workflow|continuous|modification|definition")
+_GOAL_AUTONOMY_RE = re.compile(r"autonomie|indépendance|optimiser|évoluer")
+
+# Code source contenant des patterns d'amélioration (TODO/FIXME)
+_IMPROVEMENT_SOURCE = """
+# TODO: Implement this function
+def slow_function():
+    pass
+    
+# FIXME: This has a bug
+def buggy_function():
+    return None.method()
+"""
+
+# Rapport de couverture pré-sérialisé (80/100, module2 sous le seuil de 80%)
+_COVERAGE_JSON_BYTES = json.dumps({
+    "totals": {
+        "num_statements": 100,
+        "covered_lines": 80
+    },
+    "files": {
+        "src/module1.py": {
+            "summary": {"num_statements": 50, "covered_lines": 45},
+            "missing_lines": [10, 15, 20, 25, 30]
+        },
+        "src/module2.py": {
+            "summary": {"num_statements": 50, "covered_lines": 35},
+            "missing_lines": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
+        }
+    }
+}).encode()
 
 
 class TestIndependentAutoGeneration:
@@ -20,21 +91,12 @@ class TestIndependentAutoGeneration:
     async def test_autonomous_improvement_detection(self, mock_config, temp_dir):
         """Test la détection autonome d'améliorations sans intervention"""
         # GIVEN un système d'auto-génération indépendant
-        from orchestrator.agents.self_evolution_agent import SelfEvolutionAgent
-        
         agent = SelfEvolutionAgent(mock_config)
         
-        # Créer des fichiers avec des patterns d'amélioration
-        test_file = temp_dir / "test_code.py"
-        test_file.write_text("""
-# TODO: Implement this function
-def slow_function():
-    pass
-    
-# FIXME: This has a bug
-def buggy_function():
-    return None.method()
-""")
+        # Créer des fichiers avec des patterns d'amélioration (analysés sous src/)
+        test_file = temp_dir / "src" / "test_code.py"
+        test_file.parent.mkdir()
+        test_file.write_text(_IMPROVEMENT_SOURCE)
         
         agent.main_repo_path = temp_dir
         
@@ -47,18 +109,18 @@ def buggy_function():
         # Le système doit détecter au moins des TODOs ou patterns
         improvement_types = [imp.get('type') for imp in improvements]
         possible_types = ['bug_fix', 'feature', 'performance', 'test_coverage']
+        assert set(improvement_types) <= set(possible_types)
         
-        # Au moins un type d'amélioration doit être détecté
-        detected_types = [t for t in improvement_types if t in possible_types]
-        assert len(detected_types) >= 0  # Peut être 0 si aucun pattern détecté
+        # Les TODO/FIXME du fichier doivent donner une amélioration "feature"
+        features = next(imp["features"] for imp in improvements if imp["type"] == "feature")
+        assert "# TODO: Implement this function" in features
+        assert "# FIXME: This has a bug" in features
     
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_autonomous_code_generation_without_human_input(self, mock_config):
         """Test la génération de code sans aucune intervention humaine"""
         # GIVEN un générateur de code autonome
-        from orchestrator.agents.code_generator_agent import CodeGeneratorAgent
-        
         generator = CodeGeneratorAgent(mock_config)
         
         # WHEN il génère du code de manière complètement autonome
@@ -86,12 +148,10 @@ def buggy_function():
                 generated_code.update(perf_code)
         
         # THEN du code doit être généré automatiquement
-        assert isinstance(generated_code, dict)
         assert len(generated_code) >= 0  # Peut être vide si génération échoue
         
         # Si du code est généré, il doit être valide
         for file_path, code in generated_code.items():
-            assert isinstance(code, str)
             assert len(code) > 0
     
     @pytest.mark.unit
@@ -99,50 +159,40 @@ def buggy_function():
     async def test_autonomous_sandbox_development(self, mock_config, temp_dir):
         """Test le développement autonome en sandbox"""
         # GIVEN un agent avec sandbox configurée
-        from orchestrator.agents.self_evolution_agent import SelfEvolutionAgent
-        
         agent = SelfEvolutionAgent(mock_config)
         agent.main_repo_path = temp_dir
         agent.sandbox_path = temp_dir / "sandbox"
         
-        # Mock des opérations Git pour éviter les erreurs
-        with patch('subprocess.run') as mock_subprocess:
-            mock_subprocess.return_value = Mock(returncode=0)
-            
-            # WHEN il développe de manière autonome en sandbox
-            await agent._setup_sandbox()
-            
-            # Simuler génération de code dans la sandbox
-            fake_improvements = [
-                {"type": "bug_fix", "patterns": ["test error"]}
-            ]
-            
-            success = await agent.generate_improvements(fake_improvements)
-            
-            # THEN le développement doit se faire de manière autonome
-            assert success is True
+        # Les opérations Git sont neutralisées par la fixture no_git (pytestmark)
+        # WHEN il développe de manière autonome en sandbox
+        await agent._setup_sandbox()
+        
+        # Simuler génération de code dans la sandbox
+        fake_improvements = [
+            {"type": "bug_fix", "patterns": ["test error"]}
+        ]
+        
+        success = await agent.generate_improvements(fake_improvements)
+        
+        # THEN le développement doit se faire de manière autonome
+        assert success is True
     
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_autonomous_testing_validation(self, mock_config, temp_dir):
         """Test la validation autonome par tests"""
         # GIVEN un agent avec capacité de test
-        from orchestrator.agents.self_evolution_agent import SelfEvolutionAgent
-        from orchestrator.agents.test_runner_agent import TestRunnerAgent
-        
         evolution_agent = SelfEvolutionAgent(mock_config)
         test_agent = TestRunnerAgent(mock_config)
         
         # WHEN il teste de manière autonome
-        with patch.object(test_agent, 'run_tests') as mock_run_tests:
-            mock_run_tests.return_value = {
-                "passed": 10,
-                "failed": 0,
-                "total": 10,
-                "coverage": 85.0,
-                "success": True
-            }
-            
+        with patch.object(test_agent, 'run_tests', new=AsyncMock(return_value={
+            "passed": 10,
+            "failed": 0,
+            "total": 10,
+            "coverage": 85.0,
+            "success": True
+        })):
             # Test en sandbox
             result = await evolution_agent.test_in_sandbox()
             
@@ -155,15 +205,12 @@ def buggy_function():
     async def test_autonomous_deployment_decision(self, mock_config):
         """Test la décision autonome de déploiement"""
         # GIVEN un agent d'auto-évolution
-        from orchestrator.agents.self_evolution_agent import SelfEvolutionAgent
-        
         agent = SelfEvolutionAgent(mock_config)
         
         # Mock des fichiers modifiés
-        with patch.object(agent, '_get_modified_files') as mock_modified:
-            with patch.object(agent, '_git_commit_and_push') as mock_git:
-                mock_modified.return_value = [Path("test_file.py")]
-                
+        with patch.object(agent, '_get_modified_files',
+                          new=AsyncMock(return_value=["test_file.py"])) as mock_modified:
+            with patch.object(agent, '_git_commit_and_push', new=AsyncMock()) as mock_git:
                 # WHEN il décide de déployer de manière autonome
                 await agent.push_to_main_repo()
                 
@@ -174,70 +221,49 @@ def buggy_function():
                     mock_git.assert_called_once()
 
 
+@pytest.fixture(scope="class")
+def test_runner(make_config):
+    """Agent de tests partagé par les tests d'assurance qualité"""
+    return TestRunnerAgent(make_config())
+
+
 class TestAutonomousQualityAssurance:
     """Tests pour l'assurance qualité autonome"""
     
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_autonomous_code_quality_validation(self, mock_config):
+    async def test_autonomous_code_quality_validation(self, test_runner):
         """Test la validation autonome de la qualité du code"""
         # GIVEN un système de validation qualité
-        from orchestrator.agents.test_runner_agent import TestRunnerAgent
-        
-        test_runner = TestRunnerAgent(mock_config)
         
         # WHEN il valide la qualité de manière autonome
-        with patch.object(test_runner, '_run_mypy') as mock_mypy:
-            with patch.object(test_runner, '_run_flake8') as mock_flake8:
-                with patch.object(test_runner, '_run_bandit') as mock_bandit:
-                    
-                    mock_mypy.return_value = {"success": True, "issues": 2}
-                    mock_flake8.return_value = {"success": False, "issues": 5}
-                    mock_bandit.return_value = {"success": True, "issues": 0}
-                    
-                    quality_results = await test_runner._run_quality_checks()
-                    
-                    # THEN il doit évaluer la qualité de manière autonome
-                    assert "mypy" in quality_results
-                    assert "flake8" in quality_results
-                    assert "bandit" in quality_results
-                    assert "quality_score" in quality_results
-                    
-                    # Le score doit être calculé automatiquement
-                    assert isinstance(quality_results["quality_score"], float)
+        with patch.multiple(
+            test_runner,
+            _run_mypy=AsyncMock(return_value={"success": True, "issues": 2}),
+            _run_flake8=AsyncMock(return_value={"success": False, "issues": 5}),
+            _run_bandit=AsyncMock(return_value={"success": True, "issues": 0})
+        ):
+            quality_results = await test_runner._run_quality_checks()
+        
+        # THEN il doit évaluer la qualité de manière autonome
+        assert "mypy" in quality_results
+        assert "flake8" in quality_results
+        assert "bandit" in quality_results
+        assert "quality_score" in quality_results
+        
+        # Le score doit être calculé automatiquement
+        assert isinstance(quality_results["quality_score"], float)
     
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_autonomous_coverage_analysis(self, mock_config, temp_dir):
+    async def test_autonomous_coverage_analysis(self, test_runner):
         """Test l'analyse autonome de la couverture"""
         # GIVEN un système d'analyse de couverture
-        from orchestrator.agents.test_runner_agent import TestRunnerAgent
-        
-        test_runner = TestRunnerAgent(mock_config)
         
-        # Créer un fichier de couverture mock
-        coverage_data = {
-            "totals": {
-                "num_statements": 100,
-                "covered_lines": 80
-            },
-            "files": {
-                "src/module1.py": {
-                    "summary": {"num_statements": 50, "covered_lines": 45},
-                    "missing_lines": [10, 15, 20, 25, 30]
-                },
-                "src/module2.py": {
-                    "summary": {"num_statements": 50, "covered_lines": 35},
-                    "missing_lines": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
-                }
-            }
-        }
-        
-        coverage_file = temp_dir / "coverage.json"
-        coverage_file.write_text(json.dumps(coverage_data))
-        
-        # WHEN il analyse la couverture de manière autonome
-        with patch('pathlib.Path.cwd', return_value=temp_dir):
+        # WHEN il analyse la couverture de manière autonome (rapport servi en mémoire)
+        with patch.object(Path, 'exists', return_value=True), \
+             patch('orchestrator.agents.test_runner_agent.open',
+                   mock_open(read_data=_COVERAGE_JSON_BYTES), create=True):
             coverage_result = await test_runner._analyze_coverage()
         
         # THEN il doit analyser de manière autonome
@@ -252,24 +278,19 @@ class TestAutonomousQualityAssurance:
     
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_autonomous_quality_gate_decision(self, mock_config):
+    async def test_autonomous_quality_gate_decision(self, test_runner):
         """Test la décision autonome des quality gates"""
         # GIVEN un système avec quality gates
-        from orchestrator.agents.test_runner_agent import TestRunnerAgent
-        
-        test_runner = TestRunnerAgent(mock_config)
         
         # WHEN il évalue les quality gates de manière autonome
-        with patch.object(test_runner, 'run_tests') as mock_run_tests:
-            mock_run_tests.return_value = {
-                "success": True,
-                "passed": 15,
-                "failed": 0,
-                "coverage": 85.0,
-                "mypy": {"success": True, "issues": 1},
-                "flake8": {"success": True, "issues": 3}
-            }
-            
+        with patch.object(test_runner, 'run_tests', new=AsyncMock(return_value={
+            "success": True,
+            "passed": 15,
+            "failed": 0,
+            "coverage": 85.0,
+            "mypy": {"success": True, "issues": 1},
+            "flake8": {"success": True, "issues": 3}
+        })):
             # Validation avec critères stricts
             is_valid = await test_runner.validate_code_quality(
                 min_coverage=80.0, 
@@ -277,56 +298,72 @@ class TestAutonomousQualityAssurance:
             )
             
             # THEN il doit prendre une décision autonome basée sur des critères
-            assert isinstance(is_valid, bool)
             # Avec les valeurs mock, ça devrait passer (85% > 80%, 4 issues < 10)
             assert is_valid is True
 
 
+@pytest.fixture(scope="class")
+def workflow_agents(make_config):
+    """Agents du workflow autonome (évolution, génération, tests)"""
+    return SimpleNamespace(
+        evolution=SelfEvolutionAgent(make_config()),
+        generator=CodeGeneratorAgent(make_config()),
+        runner=TestRunnerAgent(make_config())
+    )
+
+
+@pytest.fixture(scope="module")
+def meta_agent(make_config):
+    """Agent méta-cognitif partagé par le module"""
+    return MetaCognitiveAgent(make_config())
+
+
+@pytest.fixture(scope="module")
+def autonomous_orchestrator(make_config):
+    """Orchestrateur autonome partagé par le module"""
+    return AutonomousOrchestrator(make_config())
+
+
 class TestCompletelyIndependentWorkflow:
     """Tests pour le workflow complètement indépendant"""
     
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_zero_human_intervention_workflow(self, mock_config):
+    async def test_zero_human_intervention_workflow(self, workflow_agents):
         """Test un workflow sans aucune intervention humaine"""
         # GIVEN un système complètement autonome
-        from orchestrator.agents.self_evolution_agent import SelfEvolutionAgent
-        from orchestrator.agents.code_generator_agent import CodeGeneratorAgent
-        from orchestrator.agents.test_runner_agent import TestRunnerAgent
-        
-        evolution_agent = SelfEvolutionAgent(mock_config)
-        code_generator = CodeGeneratorAgent(mock_config)
-        test_runner = TestRunnerAgent(mock_config)
+        evolution_agent = workflow_agents.evolution
+        code_generator = workflow_agents.generator
+        test_runner = workflow_agents.runner
         
         # WHEN le workflow s'exécute de manière complètement autonome
-        with patch.object(evolution_agent, 'detect_improvements') as mock_detect:
-            with patch.object(code_generator, 'generate_bug_fix') as mock_generate:
-                with patch.object(test_runner, 'run_tests') as mock_test:
-                    with patch.object(evolution_agent, 'push_to_main_repo') as mock_push:
-                        
-                        # Simuler détection autonome
-                        mock_detect.return_value = [
-                            {"type": "bug_fix", "patterns": ["test error"]}
-                        ]
-                        
-                        # Simuler génération autonome
-                        mock_generate.return_value = {"src/fix.py": "# Generated fix"}
-                        
-                        # Simuler tests autonomes réussis
-                        mock_test.return_value = {
-                            "success": True,
-                            "passed": 10,
-                            "coverage": 85.0
-                        }
-                        
-                        # Exécuter le workflow autonome
-                        improvements = await evolution_agent.detect_improvements()
-                        if improvements:
-                            success = await evolution_agent.generate_improvements(improvements)
-                            if success:
-                                test_result = await evolution_agent.test_in_sandbox()
-                                if test_result:
-                                    await evolution_agent.push_to_main_repo()
+        with ExitStack() as stack:
+            # Simuler détection autonome
+            mock_detect = AsyncMock(return_value=[{"type": "bug_fix", "patterns": ["test error"]}])
+            stack.enter_context(patch.multiple(
+                evolution_agent,
+                detect_improvements=mock_detect,
+                push_to_main_repo=AsyncMock()
+            ))
+            # Simuler génération autonome
+            stack.enter_context(patch.object(
+                code_generator, 'generate_bug_fix',
+                new=AsyncMock(return_value={"src/fix.py": "# Generated fix"})
+            ))
+            # Simuler tests autonomes réussis
+            stack.enter_context(patch.object(
+                test_runner, 'run_tests',
+                new=AsyncMock(return_value={"success": True, "passed": 10, "coverage": 85.0})
+            ))
+            
+            # Exécuter le workflow autonome
+            improvements = await evolution_agent.detect_improvements()
+            if improvements:
+                success = await evolution_agent.generate_improvements(improvements)
+                if success:
+                    test_result = await evolution_agent.test_in_sandbox()
+                    if test_result:
+                        await evolution_agent.push_to_main_repo()
         
         # THEN le workflow doit s'exécuter sans intervention humaine
         mock_detect.assert_called_once()
@@ -336,46 +373,43 @@ class TestCompletelyIndependentWorkflow:
     async def test_autonomous_continuous_improvement(self, mock_config):
         """Test l'amélioration continue autonome"""
         # GIVEN un système d'amélioration continue
-        from orchestrator.agents.self_evolution_agent import SelfEvolutionAgent
-        
         agent = SelfEvolutionAgent(mock_config)
         initial_cycle = agent.evolution_cycle
         
         # WHEN il s'améliore de manière continue et autonome
-        with patch.object(agent, 'detect_improvements') as mock_detect:
-            with patch.object(agent, 'generate_improvements') as mock_generate:
-                with patch.object(agent, 'test_in_sandbox') as mock_test:
-                    with patch.object(agent, 'push_to_main_repo') as mock_push:
-                        with patch.object(agent, '_save_state') as mock_save:
-                            
-                            # Simuler plusieurs cycles d'amélioration
-                            for cycle in range(3):
-                                mock_detect.return_value = [{"type": "improvement"}]
-                                mock_generate.return_value = True
-                                mock_test.return_value = True
-                                
-                                # Simuler un cycle
-                                improvements = await agent.detect_improvements()
-                                if improvements:
-                                    success = await agent.generate_improvements(improvements)
-                                    if success:
-                                        test_passed = await agent.test_in_sandbox()
-                                        if test_passed:
-                                            await agent.push_to_main_repo()
-                                            agent.evolution_cycle += 1
+        with patch.multiple(
+            agent,
+            detect_improvements=AsyncMock(return_value=[{"type": "improvement"}]),
+            generate_improvements=AsyncMock(return_value=True),
+            test_in_sandbox=AsyncMock(return_value=True),
+            push_to_main_repo=AsyncMock(),
+            _save_state=AsyncMock()
+        ):
+            async def one_cycle():
+                improvements = await agent.detect_improvements()
+                if improvements:
+                    success = await agent.generate_improvements(improvements)
+                    if success:
+                        test_passed = await agent.test_in_sandbox()
+                        if test_passed:
+                            await agent.push_to_main_repo()
+                            agent.evolution_cycle += 1
+            
+            # Simuler plusieurs cycles d'amélioration indépendants
+            await asyncio.gather(*[one_cycle() for _ in range(3)])
         
         # THEN le système doit évoluer de manière autonome
-        assert agent.evolution_cycle > initial_cycle
+        assert agent.evolution_cycle - initial_cycle == 3
     
     @pytest.mark.integration
     @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_self_modification_autonomy(self, mock_config):
+    async def test_self_modification_autonomy(self, meta_agent):
         """Test la capacité d'auto-modification autonome"""
         # GIVEN un système avec capacité d'auto-modification
-        from orchestrator.agents.meta_cognitive_agent import MetaCognitiveAgent
-        
-        agent = MetaCognitiveAgent(mock_config)
+        agent = meta_agent
+        agent.self_modification_count = 0
+        agent.learning_history.clear()
         initial_modifications = agent.self_modification_count
         
         # WHEN il se modifie de manière autonome
@@ -400,12 +434,11 @@ class TestCompletelyIndependentWorkflow:
     
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_independent_goal_definition(self, mock_config):
+    async def test_independent_goal_definition(self, autonomous_orchestrator):
         """Test la définition autonome d'objectifs"""
         # GIVEN un système capable de se définir des objectifs
-        from orchestrator.agents.autonomous_orchestrator import AutonomousOrchestrator
-        
-        orchestrator = AutonomousOrchestrator(mock_config)
+        orchestrator = autonomous_orchestrator
+        orchestrator.config.pop("self_defined_goals", None)
         
         # WHEN il définit ses objectifs de manière autonome
         await orchestrator._develop_goal_self_definition()
@@ -418,9 +451,7 @@ class TestCompletelyIndependentWorkflow:
         
         # Les objectifs doivent être liés à l'autonomie
         goal_text = " ".join(goals)
-        autonomy_terms = ["autonomie", "indépendance", "optimiser", "évoluer"]
-        has_autonomy_focus = any(term in goal_text.lower() for term in autonomy_terms)
-        assert has_autonomy_focus
+        assert _GOAL_AUTONOMY_RE.search(goal_text.lower())
 
 
 class TestTDDForIndependence:
@@ -429,19 +460,9 @@ class TestTDDForIndependence:
     @pytest.mark.unit
     def test_independence_requirements_defined(self):
         """Test que les exigences d'indépendance sont définies par les tests"""
-        # GIVEN les exigences d'indépendance
-        independence_requirements = [
-            "autonomous_improvement_detection",
-            "autonomous_code_generation", 
-            "autonomous_testing_validation",
-            "autonomous_deployment_decision",
-            "autonomous_quality_assurance",
-            "zero_human_intervention_workflow",
-            "autonomous_goal_definition"
-        ]
-        
+        # GIVEN les exigences d'indépendance (_INDEPENDENCE_REQUIREMENTS)
         # THEN chaque exigence doit être testée
-        for requirement in independence_requirements:
+        for requirement in _INDEPENDENCE_REQUIREMENTS:
             # Vérifier que le test existe (conceptuellement)
             assert len(requirement) > 0
             assert "autonomous" in requirement or "independent" in requirement
@@ -464,24 +485,14 @@ class TestTDDForIndependence:
             
             # Les tests doivent couvrir l'indépendance/autonomie
             class_tests = " ".join(test_methods)
-            independence_terms = ["autonomous", "independent", "auto"]
-            has_independence_focus = any(term in class_tests for term in independence_terms)
-            assert has_independence_focus
+            assert _INDEPENDENCE_RE.search(class_tests)
     
     @pytest.mark.unit
     def test_coverage_for_independence_components(self):
         """Test que la couverture inclut tous les composants d'indépendance"""
-        # GIVEN les composants critiques pour l'indépendance
-        critical_components = [
-            "autonomous_orchestrator",
-            "meta_cognitive_agent",
-            "self_evolution_agent", 
-            "code_generator_agent",
-            "test_runner_agent"
-        ]
-        
+        # GIVEN les composants critiques pour l'indépendance (_CRITICAL_COMPONENTS)
         # THEN chaque composant doit être couvert par les tests
-        for component in critical_components:
+        for component in _CRITICAL_COMPONENTS:
             # Vérification conceptuelle - les imports dans les tests couvrent ces composants
             assert len(component) > 0
             assert "_" in component  # Convention de nommage respectée
@@ -489,18 +500,9 @@ class TestTDDForIndependence:
     @pytest.mark.integration
     def test_independence_integration_coverage(self):
         """Test que l'intégration pour l'indépendance est couverte"""
-        # GIVEN les scénarios d'intégration pour l'indépendance
-        integration_scenarios = [
-            "zero_human_intervention_workflow",
-            "autonomous_continuous_improvement", 
-            "self_modification_autonomy",
-            "independent_goal_definition"
-        ]
-        
+        # GIVEN les scénarios d'intégration pour l'indépendance (_INTEGRATION_SCENARIOS)
         # THEN chaque scénario doit avoir un test d'intégration
-        for scenario in integration_scenarios:
+        for scenario in _INTEGRATION_SCENARIOS:
             # Les tests d'intégration existent dans TestCompletelyIndependentWorkflow
             assert len(scenario) > 0
-            integration_terms = ["workflow", "continuous", "modification", "definition"]
-            has_integration_aspect = any(term in scenario for term in integration_terms)
-            assert has_integration_aspect
\ No newline at end of file
+            assert _INTEGRATION_RE.search(scenario)
\ No newline at end of file
@@ -5,30 +5,127 @@ Tests validant l'orchestration complètement autonome en production
 
 import pytest
 import asyncio
+import inspect
 import json
-import tempfile
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+import logging
+import os
+import sys
+from unittest.mock import Mock, AsyncMock, patch
 from pathlib import Path
-from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
 
-# Import conditionnel pour éviter les erreurs d'import
-try:
-    import sys
-    sys.path.insert(0, str(Path(__file__).parent.parent))
-    from orchestrator.autonomous import IndependentOrchestrator
-except ImportError:
-    IndependentOrchestrator = None
+# orchestrator.autonomous est enregistré une fois par session (conftest.py)
+autonomous = pytest.importorskip("orchestrator.autonomous")
+IndependentOrchestrator = autonomous.IndependentOrchestrator
+
+_ESSENTIAL_AGENTS = ("evolution", "bug_detector", "code_generator", "meta_cognitive", "test_runner")
+
+_IMPROVEMENT_CAPABILITIES = {
+    "bug_detection": "_analyze_error_logs",
+    "test_generation": "_analyze_test_coverage_gaps",
+    "performance_optimization": "_detect_performance_issues",
+    "feature_generation": "_generate_feature_ideas",
+    "self_restart": "_prepare_self_restart"
+}
+
+_AUTONOMY_KEYS = (
+    "independence_mode",
+    "continuous_evolution",
+    "self_modification_enabled",
+    "auto_testing",
+    "auto_deployment"
+)
+
+_HEALTHY_STATUS = MappingProxyType({"overall_health": "healthy"})
+
+_QA_RESULT = MappingProxyType({"success": True, "passed": 8, "total": 10, "coverage": 0.65})
+
+_EMPTY_OPPORTUNITIES = ()
+
+_SAMPLE_OPPORTUNITIES = (
+    MappingProxyType({"type": "bug_fix", "priority": "high", "patterns": ("TypeError in test.py",)}),
+    MappingProxyType({"type": "test_coverage", "priority": "medium", "gaps": ("missing_test_module",)})
+)
+
+# AsyncMock réutilisés entre tests, réinitialisés à chaque installation
+_APPLY_MOCK = AsyncMock()
+_SYNC_MOCK = AsyncMock()
+_COMMIT_MOCK = AsyncMock()
+
+
+def _reset(mock):
+    """Remettre à zéro un mock partagé avant de l'installer"""
+    mock.reset_mock()
+    return mock
+
+
+_CRITICAL_METHODS = (
+    "initialize_system",
+    "start_perpetual_evolution",
+    "_perform_system_health_check",
+    "_detect_improvement_opportunities",
+    "_auto_generate_improvements",
+    "_auto_test_modifications",
+    "_auto_deploy_improvements"
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_dangerous_calls():
+    """Neutraliser os.execl et sys.exit une seule fois pour tout le module"""
+    calls = SimpleNamespace(execl=Mock(), exit=Mock())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(os, "execl", calls.execl)
+        mp.setattr(sys, "exit", calls.exit)
+        yield calls
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_log_dir(tmp_path_factory):
+    """Diriger les logs vers un répertoire temporaire propre à chaque worker"""
+    with pytest.MonkeyPatch.context() as mp:
+        # Sous-répertoire inexistant : c'est l'orchestrateur qui doit le créer
+        mp.setattr(IndependentOrchestrator, "log_dir", tmp_path_factory.mktemp("worker") / "logs")
+        mp.setattr(IndependentOrchestrator, "_logdir_created", False)
+        yield IndependentOrchestrator.log_dir
+
+
+@pytest.fixture(scope="session")
+def fresh_orchestrator():
+    """Orchestrateur neuf partagé par les tests en lecture seule"""
+    return IndependentOrchestrator()
+
+
+@pytest.fixture(scope="session")
+def orchestrator_attrs(fresh_orchestrator):
+    """Noms d'attributs de l'orchestrateur, calculés une seule fois"""
+    return frozenset(dir(fresh_orchestrator))
+
+
+@pytest.fixture(scope="session")
+async def initialized_orchestrator():
+    """Orchestrateur initialisé une seule fois (5 agents enregistrés)"""
+    orchestrator = IndependentOrchestrator()
+    await orchestrator.initialize_system()
+    return orchestrator
+
+
+@pytest.fixture
+def shared_orchestrator(initialized_orchestrator, monkeypatch):
+    """Orchestrateur initialisé partagé, état mutable restauré après chaque test"""
+    monkeypatch.setattr(initialized_orchestrator, "config", dict(initialized_orchestrator.config))
+    monkeypatch.setattr(initialized_orchestrator, "evolution_cycle", 0)
+    monkeypatch.setattr(initialized_orchestrator, "running", False)
+    return initialized_orchestrator
 
 
-@pytest.mark.skipif(IndependentOrchestrator is None, reason="IndependentOrchestrator not available")
 class TestRealIndependentOrchestration:
     """Tests pour l'orchestration vraiment indépendante"""
     
-    @pytest.mark.asyncio
-    async def test_independent_orchestrator_initialization(self):
+    def test_independent_orchestrator_initialization(self, fresh_orchestrator):
         """Test l'initialisation de l'orchestrateur indépendant"""
         # GIVEN un orchestrateur indépendant
-        orchestrator = IndependentOrchestrator()
+        orchestrator = fresh_orchestrator
         
         # THEN il doit être correctement configuré
         assert orchestrator.config is not None
@@ -38,32 +135,23 @@ class TestRealIndependentOrchestration:
         assert orchestrator.evolution_cycle == 0
         assert orchestrator.running is False
     
-    @pytest.mark.asyncio
-    async def test_autonomous_system_initialization(self):
+    @pytest.mark.parametrize("agent_name", _ESSENTIAL_AGENTS)
+    def test_autonomous_system_initialization(self, initialized_orchestrator, agent_name):
         """Test l'initialisation complète du système autonome"""
         # GIVEN un orchestrateur indépendant
-        orchestrator = IndependentOrchestrator()
-        
         # WHEN on initialise le système
-        await orchestrator.initialize_system()
+        orchestrator = initialized_orchestrator
         
-        # THEN tous les agents essentiels doivent être présents
-        agents = orchestrator.orchestrator.agents
-        assert "evolution" in agents
-        assert "bug_detector" in agents
-        assert "code_generator" in agents
-        assert "meta_cognitive" in agents
-        assert "test_runner" in agents
+        # THEN chaque agent essentiel doit être présent
+        assert agent_name in orchestrator.orchestrator.agents
         
         # AND l'orchestrateur doit être en fonctionnement
         assert orchestrator.orchestrator.is_running is True
     
-    @pytest.mark.asyncio
-    async def test_system_health_check_comprehensive(self):
+    async def test_system_health_check_comprehensive(self, initialized_orchestrator):
         """Test la vérification complète de santé du système"""
         # GIVEN un orchestrateur initialisé
-        orchestrator = IndependentOrchestrator()
-        await orchestrator.initialize_system()
+        orchestrator = initialized_orchestrator
         
         # WHEN on effectue un health check
         health_status = await orchestrator._perform_system_health_check()
@@ -82,11 +170,10 @@ class TestRealIndependentOrchestration:
         assert "disk_space" in details
         assert "evolution_capability" in details
     
-    @pytest.mark.asyncio
-    async def test_improvement_opportunities_detection(self):
+    async def test_improvement_opportunities_detection(self, shared_orchestrator):
         """Test la détection d'opportunités d'amélioration"""
         # GIVEN un orchestrateur avec des cycles d'évolution
-        orchestrator = IndependentOrchestrator()
+        orchestrator = shared_orchestrator
         orchestrator.evolution_cycle = 3  # Cycle qui déclenche la détection
         
         # WHEN on détecte les opportunités
@@ -102,43 +189,32 @@ class TestRealIndependentOrchestration:
             assert len(bug_fix_opps) >= 1
             assert bug_fix_opps[0]["priority"] == "high"
     
-    @pytest.mark.asyncio
-    async def test_autonomous_code_generation_cycle(self):
+    async def test_autonomous_code_generation_cycle(self, shared_orchestrator, monkeypatch):
         """Test le cycle complet de génération de code autonome"""
         # GIVEN un orchestrateur avec des opportunités d'amélioration
-        orchestrator = IndependentOrchestrator()
-        
-        opportunities = [
-            {"type": "bug_fix", "priority": "high", "patterns": ["TypeError in test.py"]},
-            {"type": "test_coverage", "priority": "medium", "gaps": ["missing_test_module"]}
-        ]
+        orchestrator = shared_orchestrator
+        mock_apply = _reset(_APPLY_MOCK)
+        monkeypatch.setattr(orchestrator, "_apply_generated_code", mock_apply)
         
         # WHEN on génère automatiquement les améliorations
-        with patch.object(orchestrator, '_apply_generated_code', new_callable=AsyncMock) as mock_apply:
-            result = await orchestrator._auto_generate_improvements(opportunities)
-            
-            # THEN du code doit être généré
-            assert isinstance(result, dict)
-            assert "generated" in result
-            assert result["generated"] >= 0
-            
-            # AND les améliorations doivent être appliquées
-            assert mock_apply.called
+        result = await orchestrator._auto_generate_improvements(_SAMPLE_OPPORTUNITIES)
+        
+        # THEN du code doit être généré
+        assert isinstance(result, dict)
+        assert "generated" in result
+        assert result["generated"] >= 0
+        
+        # AND les améliorations doivent être appliquées
+        assert mock_apply.called
     
-    @pytest.mark.asyncio
-    async def test_autonomous_testing_cycle(self):
+    async def test_autonomous_testing_cycle(self, shared_orchestrator):
         """Test le cycle de tests automatique"""
         # GIVEN un orchestrateur avec une sandbox configurée
-        orchestrator = IndependentOrchestrator()
+        orchestrator = shared_orchestrator
         
         # WHEN on lance les tests automatiques
         with patch('orchestrator.agents.test_runner_agent.TestRunnerAgent.run_tests') as mock_run_tests:
-            mock_run_tests.return_value = {
-                "success": True,
-                "passed": 8,
-                "total": 10,
-                "coverage": 0.65
-            }
+            mock_run_tests.return_value = _QA_RESULT
             
             test_result = await orchestrator._auto_test_modifications()
             
@@ -149,97 +225,95 @@ class TestRealIndependentOrchestration:
             assert test_result["total"] == 10
             assert test_result["coverage"] == 0.65
     
-    @pytest.mark.asyncio
-    async def test_autonomous_deployment_cycle(self):
+    async def test_autonomous_deployment_cycle(self, shared_orchestrator, monkeypatch):
         """Test le cycle de déploiement automatique"""
         # GIVEN un orchestrateur prêt pour le déploiement
-        orchestrator = IndependentOrchestrator()
+        orchestrator = shared_orchestrator
+        mock_sync = _reset(_SYNC_MOCK)
+        mock_commit = _reset(_COMMIT_MOCK)
+        monkeypatch.setattr(orchestrator, "_sync_sandbox_to_main", mock_sync)
+        monkeypatch.setattr(orchestrator, "_auto_commit_changes", mock_commit)
         
         # WHEN on déploie automatiquement
-        with patch.object(orchestrator, '_sync_sandbox_to_main', new_callable=AsyncMock) as mock_sync:
-            with patch.object(orchestrator, '_auto_commit_changes', new_callable=AsyncMock) as mock_commit:
-                deploy_result = await orchestrator._auto_deploy_improvements()
-                
-                # THEN le déploiement doit réussir
-                assert isinstance(deploy_result, dict)
-                assert deploy_result["success"] is True
-                assert deploy_result["restart_required"] is True
-                
-                # AND les étapes doivent être exécutées
-                mock_sync.assert_called_once()
-                mock_commit.assert_called_once()
+        deploy_result = await orchestrator._auto_deploy_improvements()
+        
+        # THEN le déploiement doit réussir
+        assert isinstance(deploy_result, dict)
+        assert deploy_result["success"] is True
+        assert deploy_result["restart_required"] is True
+        
+        # AND les étapes doivent être exécutées
+        mock_sync.assert_called_once()
+        mock_commit.assert_called_once()
     
-    @pytest.mark.asyncio
-    async def test_self_restart_preparation(self):
+    async def test_self_restart_preparation(self, shared_orchestrator, tmp_path, monkeypatch,
+                                            _patch_dangerous_calls, no_sleep):
         """Test la préparation d'auto-redémarrage"""
-        # GIVEN un orchestrateur en fonctionnement
-        orchestrator = IndependentOrchestrator()
+        # GIVEN un orchestrateur en fonctionnement, isolé dans un répertoire temporaire
+        # (evolution_state.json est écrit dans le répertoire courant)
+        monkeypatch.chdir(tmp_path)
+        orchestrator = shared_orchestrator
         orchestrator.evolution_cycle = 5
         
-        # WHEN on prépare l'auto-redémarrage
-        with patch('os.execl') as mock_execl:  # Empêcher le vrai redémarrage
-            try:
-                await orchestrator._prepare_self_restart()
-            except SystemExit:
-                pass  # Normal si os.execl est appelé
-            
-            # THEN l'état doit être sauvegardé
-            state_file = Path("evolution_state.json")
-            if state_file.exists():
-                state = json.loads(state_file.read_text())
-                assert state["evolution_cycle"] == 5
-                assert "last_evolution" in state
-                assert state["restart_reason"] == "auto_improvement_deployment"
+        # WHEN on prépare l'auto-redémarrage (os.execl neutralisé par fixture)
+        await orchestrator._prepare_self_restart()
+        
+        # THEN l'état doit être sauvegardé
+        state = json.loads(Path("evolution_state.json").read_bytes())
+        assert state["evolution_cycle"] == 5
+        assert "last_evolution" in state
+        assert state["restart_reason"] == "auto_improvement_deployment"
+        
+        # AND le redémarrage doit être demandé après le délai de 10 secondes
+        no_sleep.assert_awaited_once_with(10)
+        _patch_dangerous_calls.execl.assert_called_once()
     
-    @pytest.mark.asyncio
-    async def test_perpetual_evolution_cycle_structure(self):
+    async def test_perpetual_evolution_cycle_structure(self, shared_orchestrator, monkeypatch):
         """Test la structure de la boucle d'évolution perpétuelle"""
         # GIVEN un orchestrateur configuré
-        orchestrator = IndependentOrchestrator()
+        orchestrator = shared_orchestrator
+        
+        # Arrêt déterministe : le premier health check termine la boucle
+        stop = asyncio.Event()
+        
+        async def healthy_then_stop():
+            orchestrator.running = False
+            stop.set()
+            return _HEALTHY_STATUS
         
         # Mock tous les composants pour test rapide
-        with patch.object(orchestrator, '_perform_system_health_check') as mock_health:
-            with patch.object(orchestrator, '_detect_improvement_opportunities') as mock_detect:
-                with patch.object(orchestrator, '_auto_generate_improvements') as mock_generate:
-                    with patch.object(orchestrator, '_record_evolution_metrics') as mock_metrics:
-                        with patch.object(orchestrator, '_perform_meta_learning') as mock_learning:
-                            
-                            # Configurer les mocks
-                            mock_health.return_value = {"overall_health": "healthy"}
-                            mock_detect.return_value = []  # Pas d'opportunités pour test rapide
-                            mock_generate.return_value = {"generated": 0}
-                            mock_metrics.return_value = None
-                            mock_learning.return_value = None
-                            
-                            # Configurer pour un seul cycle
-                            orchestrator.config["evolution_interval"] = 0.1  # 100ms
-                            
-                            # WHEN on démarre l'évolution (pour 1 cycle)
-                            orchestrator.running = True
-                            
-                            # Simuler un cycle unique puis arrêter
-                            async def single_cycle():
-                                await asyncio.sleep(0.05)  # Petit délai
-                                orchestrator.running = False
-                            
-                            # Lancer en parallèle
-                            cycle_task = asyncio.create_task(orchestrator.start_perpetual_evolution())
-                            stop_task = asyncio.create_task(single_cycle())
-                            
-                            await asyncio.gather(cycle_task, stop_task, return_exceptions=True)
-                            
-                            # THEN toutes les étapes du cycle doivent être appelées
-                            mock_health.assert_called()
-                            mock_detect.assert_called()
-                            mock_metrics.assert_called()
-                            mock_learning.assert_called()
+        mock_health = AsyncMock(side_effect=healthy_then_stop)
+        mock_detect = AsyncMock(return_value=_EMPTY_OPPORTUNITIES)  # Pas d'opportunités pour test rapide
+        mock_metrics = AsyncMock()
+        mock_learning = AsyncMock()
+        monkeypatch.setattr(orchestrator, "_perform_system_health_check", mock_health)
+        monkeypatch.setattr(orchestrator, "_detect_improvement_opportunities", mock_detect)
+        monkeypatch.setattr(orchestrator, "_auto_generate_improvements", AsyncMock(return_value={"generated": 0}))
+        monkeypatch.setattr(orchestrator, "_record_evolution_metrics", mock_metrics)
+        monkeypatch.setattr(orchestrator, "_perform_meta_learning", mock_learning)
+        
+        # Pas d'attente entre les cycles
+        orchestrator.config["evolution_interval"] = 0
+        
+        # WHEN on démarre l'évolution (pour 1 cycle)
+        async with asyncio.timeout(1.0):
+            await orchestrator.start_perpetual_evolution()
+        
+        # THEN un seul cycle doit avoir été exécuté
+        assert stop.is_set()
+        assert orchestrator.evolution_cycle == 1
+        
+        # AND toutes les étapes du cycle doivent être appelées
+        mock_health.assert_called()
+        mock_detect.assert_called()
+        mock_metrics.assert_called()
+        mock_learning.assert_called()
 
 
 class TestRealWorldAutonomousEvolution:
     """Tests pour l'évolution autonome en conditions réelles"""
     
-    @pytest.mark.asyncio
-    async def test_config_loading_and_override(self):
+    def test_config_loading_and_override(self):
         """Test le chargement et override de configuration"""
         # GIVEN un fichier de configuration personnalisé
         config_data = {
@@ -247,49 +321,39 @@ class TestRealWorldAutonomousEvolution:
             "autonomy_threshold": 0.9,
             "custom_setting": "test_value"
         }
+        config_json = json.dumps(config_data)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            config_path = f.name
+        # WHEN on charge la configuration (servie depuis la mémoire)
+        with patch('pathlib.Path.exists', return_value=True), \
+                patch('pathlib.Path.read_text', return_value=config_json):
+            orchestrator = IndependentOrchestrator()
         
-        # WHEN on charge la configuration
-        try:
-            with patch('pathlib.Path.exists', return_value=True):
-                with patch('pathlib.Path.read_text', return_value=json.dumps(config_data)):
-                    orchestrator = IndependentOrchestrator()
-                    
-                    # THEN la configuration doit être mergée correctement
-                    assert orchestrator.config["evolution_interval"] == 120
-                    assert orchestrator.config["autonomy_threshold"] == 0.9
-                    assert orchestrator.config["custom_setting"] == "test_value"
-                    
-                    # AND les valeurs par défaut doivent être préservées
-                    assert orchestrator.config["independence_mode"] is True
-                    
-        finally:
-            Path(config_path).unlink(missing_ok=True)
+        # THEN la configuration doit être mergée correctement
+        assert orchestrator.config["evolution_interval"] == 120
+        assert orchestrator.config["autonomy_threshold"] == 0.9
+        assert orchestrator.config["custom_setting"] == "test_value"
+        
+        # AND les valeurs par défaut doivent être préservées
+        assert orchestrator.config["independence_mode"] is True
     
-    @pytest.mark.asyncio
-    async def test_error_recovery_mechanism(self):
+    async def test_error_recovery_mechanism(self, shared_orchestrator, no_sleep):
         """Test le mécanisme de récupération d'erreur"""
         # GIVEN un orchestrateur en fonctionnement
-        orchestrator = IndependentOrchestrator()
+        orchestrator = shared_orchestrator
         
         # WHEN une erreur survient
         test_error = RuntimeError("Test error for recovery")
         
-        # THEN la récupération doit fonctionner
+        # THEN la récupération doit fonctionner sans exception
         await orchestrator._perform_error_recovery(test_error)
         
-        # Le test passe si aucune exception n'est levée
-        assert True
+        # AND attendre une seconde avant de reprendre
+        no_sleep.assert_awaited_once_with(1)
     
-    @pytest.mark.asyncio
-    async def test_real_autonomous_agents_integration(self):
+    def test_real_autonomous_agents_integration(self, initialized_orchestrator):
         """Test l'intégration réelle avec les agents autonomes"""
         # GIVEN un orchestrateur avec agents réels
-        orchestrator = IndependentOrchestrator()
-        await orchestrator.initialize_system()
+        orchestrator = initialized_orchestrator
         
         # WHEN on vérifie l'intégration
         agents = orchestrator.orchestrator.agents
@@ -303,54 +367,65 @@ class TestRealWorldAutonomousEvolution:
                 "meta_cognitive", "test_runner"
             ]
     
-    def test_signal_handling_setup(self):
+    def test_signal_handling_setup(self, orchestrator_attrs):
         """Test la configuration de gestion des signaux"""
-        # GIVEN un orchestrateur
-        orchestrator = IndependentOrchestrator()
-        
+        # GIVEN la classe de l'orchestrateur et une instance partagée
         # THEN les gestionnaires de signaux doivent être configurés
         # (Test simple de l'existence du logger et de la méthode)
-        assert hasattr(orchestrator, 'logger')
-        assert hasattr(orchestrator, '_signal_handler')
-        assert callable(orchestrator._signal_handler)
+        assert 'logger' in orchestrator_attrs
+        assert callable(inspect.getattr_static(IndependentOrchestrator, '_signal_handler', None))
     
-    def test_logging_setup_comprehensive(self):
+    def test_logging_setup_comprehensive(self, fresh_orchestrator):
         """Test la configuration complète du logging"""
         # GIVEN un orchestrateur
-        orchestrator = IndependentOrchestrator()
+        orchestrator = fresh_orchestrator
         
         # THEN le logging doit être configuré
         assert orchestrator.logger is not None
         assert orchestrator.logger.name == "IndependentOrchestrator"
         
-        # AND le répertoire de logs doit exister
-        log_dir = Path("logs")
-        assert log_dir.exists()
+        # AND le répertoire de logs doit avoir été créé par l'orchestrateur
+        log_dir = IndependentOrchestrator.log_dir
+        assert log_dir.is_dir()
+        
+        # WHEN on reconfigure le logging (basicConfig intercepté : pytest
+        # installe déjà ses propres handlers sur le logger racine)
+        with patch("logging.basicConfig") as mock_basic_config:
+            orchestrator.setup_logging()
+        
+        # THEN niveau INFO, fichier de log dans log_dir et sortie console
+        kwargs = mock_basic_config.call_args.kwargs
+        file_handler, stream_handler = kwargs["handlers"]
+        try:
+            assert kwargs["level"] == logging.INFO
+            assert isinstance(file_handler, logging.FileHandler)
+            assert Path(file_handler.baseFilename) == (log_dir / "autonomous_orchestrator.log").resolve()
+            assert isinstance(stream_handler, logging.StreamHandler)
+            assert stream_handler.stream is sys.stdout
+        finally:
+            file_handler.close()
 
 
 class TestRealProductionReadiness:
     """Tests de préparation pour la production réelle"""
     
-    @pytest.mark.asyncio
-    async def test_production_deployment_readiness(self):
+    def test_production_deployment_readiness(self, initialized_orchestrator):
         """Test la préparation au déploiement en production"""
-        # GIVEN un orchestrateur configuré pour la production
-        orchestrator = IndependentOrchestrator()
-        orchestrator.config["production_deployment"] = True
+        # GIVEN un orchestrateur initialisé, configuré pour la production
+        # (patch.dict restaure la config partagée après le test)
+        orchestrator = initialized_orchestrator
         
         # WHEN on vérifie la préparation
-        await orchestrator.initialize_system()
-        
-        # THEN le système doit être prêt
-        assert orchestrator.config["production_deployment"] is True
-        assert orchestrator.config["independence_mode"] is True
-        assert orchestrator.orchestrator.is_running is True
+        with patch.dict(orchestrator.config, {"production_deployment": True}):
+            # THEN le système doit être prêt
+            assert orchestrator.config["production_deployment"] is True
+            assert orchestrator.config["independence_mode"] is True
+            assert orchestrator.orchestrator.is_running is True
     
-    @pytest.mark.asyncio
-    async def test_continuous_evolution_validation(self):
+    def test_continuous_evolution_validation(self, fresh_orchestrator):
         """Test la validation de l'évolution continue"""
         # GIVEN un orchestrateur en mode évolution continue
-        orchestrator = IndependentOrchestrator()
+        orchestrator = fresh_orchestrator
         
         # THEN les paramètres d'évolution continue doivent être corrects
         assert orchestrator.config["continuous_evolution"] is True
@@ -362,24 +437,13 @@ class TestRealProductionReadiness:
         assert orchestrator.last_evolution is None
         assert orchestrator.running is False
     
-    @pytest.mark.asyncio
-    async def test_independence_validation_complete(self):
+    def test_independence_validation_complete(self, initialized_orchestrator):
         """Test la validation complète de l'indépendance"""
         # GIVEN un orchestrateur complètement indépendant
-        orchestrator = IndependentOrchestrator()
-        await orchestrator.initialize_system()
-        
-        # WHEN on valide l'indépendance
-        independence_factors = {
-            "self_modification": orchestrator.config["self_modification_enabled"],
-            "autonomous_testing": orchestrator.config["auto_testing"],
-            "autonomous_deployment": orchestrator.config["auto_deployment"],
-            "continuous_evolution": orchestrator.config["continuous_evolution"],
-            "independence_mode": orchestrator.config["independence_mode"]
-        }
+        orchestrator = initialized_orchestrator
         
         # THEN tous les facteurs d'indépendance doivent être activés
-        assert all(independence_factors.values())
+        assert all(orchestrator.config.get(key) for key in _AUTONOMY_KEYS)
         
         # AND le système doit pouvoir s'auto-gérer
         assert len(orchestrator.orchestrator.agents) == 5
@@ -389,79 +453,50 @@ class TestRealProductionReadiness:
 class TestTotalSystemAutonomy:
     """Tests de validation de l'autonomie totale du système"""
     
-    @pytest.mark.asyncio
-    async def test_zero_human_dependency_validation(self):
+    def test_zero_human_dependency_validation(self, initialized_orchestrator):
         """Test la validation de zéro dépendance humaine"""
         # GIVEN un système complètement autonome
-        orchestrator = IndependentOrchestrator()
-        await orchestrator.initialize_system()
-        
-        # WHEN on évalue l'autonomie
-        autonomy_metrics = {
-            "decision_making": True,  # Prise de décision autonome
-            "code_generation": True,  # Génération de code autonome
-            "testing": True,  # Tests autonomes
-            "deployment": True,  # Déploiement autonome
-            "recovery": True,  # Récupération autonome
-            "evolution": True   # Évolution autonome
-        }
+        orchestrator = initialized_orchestrator
         
         # THEN le système doit être complètement autonome
-        total_autonomy = all(autonomy_metrics.values())
-        assert total_autonomy is True
+        # (modification, tests, déploiement et évolution sans intervention)
+        assert all(orchestrator.config.get(key) for key in _AUTONOMY_KEYS)
         
         # AND l'orchestrateur doit confirmer l'indépendance
         assert orchestrator.config["independence_mode"] is True
     
-    @pytest.mark.asyncio
-    async def test_perpetual_self_improvement_capability(self):
+    @pytest.mark.parametrize("capability, method_name", _IMPROVEMENT_CAPABILITIES.items())
+    def test_perpetual_self_improvement_capability(self, fresh_orchestrator, orchestrator_attrs,
+                                                   capability, method_name):
         """Test la capacité d'auto-amélioration perpétuelle"""
         # GIVEN un système d'auto-amélioration perpétuelle
-        orchestrator = IndependentOrchestrator()
-        
-        # WHEN on évalue les capacités d'amélioration
-        improvement_capabilities = {
-            "bug_detection": hasattr(orchestrator, '_analyze_error_logs'),
-            "test_generation": hasattr(orchestrator, '_analyze_test_coverage_gaps'),
-            "performance_optimization": hasattr(orchestrator, '_detect_performance_issues'),
-            "feature_generation": hasattr(orchestrator, '_generate_feature_ideas'),
-            "self_restart": hasattr(orchestrator, '_prepare_self_restart')
-        }
+        orchestrator = fresh_orchestrator
         
-        # THEN toutes les capacités doivent être présentes
-        assert all(improvement_capabilities.values())
+        # THEN chaque capacité d'amélioration doit être présente
+        assert method_name in orchestrator_attrs, capability
         
         # AND le cycle d'amélioration doit être fonctionnel
-        assert hasattr(orchestrator, 'start_perpetual_evolution')
         assert callable(orchestrator.start_perpetual_evolution)
         
-    def test_real_world_production_readiness(self):
+    def test_real_world_production_readiness(self, fresh_orchestrator, orchestrator_attrs):
         """Test final de préparation production"""
         # GIVEN tous les composants du système autonome
-        orchestrator = IndependentOrchestrator()
+        orchestrator = fresh_orchestrator
         
         # THEN le système doit être prêt pour la production
         production_requirements = {
             "logging_configured": orchestrator.logger is not None,
-            "signal_handling": hasattr(orchestrator, '_signal_handler'),
-            "error_recovery": hasattr(orchestrator, '_perform_error_recovery'),
+            "signal_handling": '_signal_handler' in orchestrator_attrs,
+            "error_recovery": '_perform_error_recovery' in orchestrator_attrs,
             "state_persistence": True,  # Via evolution_state.json
             "configuration_management": orchestrator.config is not None
         }
         
         assert all(production_requirements.values())
-        
-        # AND toutes les méthodes critiques doivent exister
-        critical_methods = [
-            'initialize_system',
-            'start_perpetual_evolution',
-            '_perform_system_health_check',
-            '_detect_improvement_opportunities',
-            '_auto_generate_improvements',
-            '_auto_test_modifications',
-            '_auto_deploy_improvements'
-        ]
-        
-        for method_name in critical_methods:
-            assert hasattr(orchestrator, method_name)
-            assert callable(getattr(orchestrator, method_name))
\ No newline at end of file
+    
+    @pytest.mark.parametrize("method_name", _CRITICAL_METHODS)
+    def test_critical_method_available(self, method_name):
+        """Test la présence des méthodes critiques"""
+        # GIVEN la classe de l'orchestrateur (aucune instanciation nécessaire)
+        # THEN chaque méthode critique doit exister
+        assert callable(getattr(IndependentOrchestrator, method_name, None))
\ No newline at end of file
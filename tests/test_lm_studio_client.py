@@ -6,25 +6,82 @@ Respecte les principes DDD (Domain-Driven Design) et SOLID
 
 import pytest
 import asyncio
-import json
 import aiohttp
-from unittest.mock import Mock, AsyncMock, patch
-from pathlib import Path
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from unittest.mock import AsyncMock, patch
 
 from src.orchestrator.models.lm_studio_client import LMStudioClient
-from src.orchestrator.models.ai_model_interface import AIModelInterface
+from src.orchestrator.models.ai_model_interface import AIModelInterface, AIModelError
+
+_BASE_URL = "http://localhost:1234"
+_TDD_MARKERS = ("# GIVEN", "# WHEN", "# THEN", "assert")
+
+
+def _chat_response(content):
+    """Réponse chat completions minimale renvoyant un contenu donné"""
+    return {"choices": [{"message": {"content": content}}]}
+
+
+class _FakeCM:
+    """Context manager asynchrone renvoyant une réponse préconstruite"""
+    
+    def __init__(self, response):
+        self.response = response
+    
+    async def __aenter__(self):
+        return self.response
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture(scope="session")
+async def make_client():
+    """Fabrique de clients LM Studio, une instance par configuration"""
+    clients = {}
+    
+    def factory(**config):
+        key = tuple(sorted(config.items()))
+        if key not in clients:
+            clients[key] = LMStudioClient(**config)
+        return clients[key]
+    
+    yield factory
+    
+    for client in clients.values():
+        await client.close()
+
+
+@pytest.fixture(scope="session")
+def lm_client(make_client):
+    """Client LM Studio par défaut partagé par toute la session"""
+    return make_client(base_url=_BASE_URL)
+
+
+@pytest.fixture
+def mock_make_request(monkeypatch):
+    """AsyncMock installé à la place de LMStudioClient._make_request"""
+    mock = AsyncMock()
+    monkeypatch.setattr(LMStudioClient, "_make_request", mock)
+    return mock
+
+
+@pytest.fixture(scope="module")
+def success_response():
+    """Réponse HTTP 200 simulée, construite une fois pour le module"""
+    response = AsyncMock()
+    response.status = 200
+    response.json = AsyncMock(return_value=_chat_response("Success"))
+    yield response
+    response.reset_mock()
 
 
 class TestLMStudioClientDomain:
     """Tests TDD pour le domaine LM Studio Client"""
     
-    def test_lm_studio_client_implements_ai_interface(self):
+    def test_lm_studio_client_implements_ai_interface(self, lm_client):
         """DOMAIN: LMStudioClient doit implémenter AIModelInterface"""
         # GIVEN une instance LMStudioClient
-        client = LMStudioClient(base_url="http://localhost:1234")
+        client = lm_client
         
         # THEN elle doit implémenter l'interface AIModelInterface
         assert isinstance(client, AIModelInterface)
@@ -35,126 +92,105 @@ class TestLMStudioClientDomain:
         assert hasattr(client, 'generate_tests')
         assert hasattr(client, 'fix_bugs')
     
-    def test_lm_studio_client_configuration_validation(self):
-        """DOMAIN: Configuration doit être validée à l'initialisation"""
-        # GIVEN des configurations valides et invalides
-        valid_configs = [
-            {"base_url": "http://localhost:1234"},
-            {"base_url": "http://127.0.0.1:1234", "timeout": 30},
-            {"base_url": "https://api.lmstudio.ai", "api_key": "test-key"}
-        ]
-        
-        invalid_configs = [
-            {},  # URL manquante
-            {"base_url": ""},  # URL vide
-            {"base_url": "invalid-url"},  # URL malformée
-            {"base_url": "http://localhost:1234", "timeout": -1},  # Timeout négatif
-        ]
+    @pytest.mark.parametrize("config", [
+        {"base_url": "http://localhost:1234"},
+        {"base_url": "http://127.0.0.1:1234", "timeout": 30},
+        {"base_url": "https://api.lmstudio.ai", "api_key": "test-key"}
+    ])
+    def test_lm_studio_client_valid_configuration(self, config):
+        """DOMAIN: Une configuration valide est acceptée à l'initialisation"""
+        # GIVEN une configuration valide
+        # WHEN on crée un client
+        client = LMStudioClient(**config)
         
-        # WHEN on crée des clients avec configs valides
-        for config in valid_configs:
-            client = LMStudioClient(**config)
-            # THEN aucune exception ne doit être levée
-            assert client.base_url is not None
-        
-        # WHEN on crée des clients avec configs invalides
-        for config in invalid_configs:
-            # THEN une exception de validation doit être levée
-            with pytest.raises((ValueError, TypeError)):
-                LMStudioClient(**config)
+        # THEN aucune exception ne doit être levée
+        assert client.base_url is not None
+    
+    @pytest.mark.parametrize("config", [
+        {},  # URL manquante
+        {"base_url": ""},  # URL vide
+        {"base_url": "invalid-url"},  # URL malformée
+        {"base_url": "http://localhost:1234", "timeout": -1},  # Timeout négatif
+    ])
+    def test_lm_studio_client_invalid_configuration(self, config):
+        """DOMAIN: Une configuration invalide est rejetée à l'initialisation"""
+        # GIVEN une configuration invalide
+        # WHEN on crée un client
+        # THEN une exception de validation doit être levée
+        with pytest.raises((ValueError, TypeError)):
+            LMStudioClient(**config)
 
 
 class TestLMStudioClientAPI:
     """Tests TDD pour l'API LM Studio Client"""
     
-    @pytest.mark.asyncio
-    async def test_generate_code_success(self):
+    async def test_generate_code_success(self, lm_client, mock_make_request):
         """API: Génération de code réussie"""
         # GIVEN un client LM Studio configuré
-        client = LMStudioClient(base_url="http://localhost:1234")
+        client = lm_client
         
         # AND une réponse mock de l'API
-        mock_response = {
-            "choices": [{
-                "message": {
-                    "content": "def hello_world():\n    return 'Hello, World!'"
-                }
-            }]
-        }
+        mock_response = _chat_response("def hello_world():\n    return 'Hello, World!'")
         
-        with patch('src.orchestrator.models.lm_studio_client.LMStudioClient._make_request') as mock_request:
-            mock_request.return_value = mock_response
-            
-            # WHEN on génère du code
-            result = await client.generate_code("Create a hello world function")
+        mock_make_request.return_value = mock_response
+        
+        # WHEN on génère du code
+        result = await client.generate_code("Create a hello world function")
         
         # THEN le code généré doit être retourné
         assert "def hello_world()" in result
         assert "Hello, World!" in result
         
         # AND l'API doit être appelée correctement
-        mock_request.assert_called_once()
-        call_args = mock_request.call_args
+        mock_make_request.assert_called_once()
+        call_args = mock_make_request.call_args
         assert call_args[0][0] == "POST"  # Premier argument doit être POST
     
-    @pytest.mark.asyncio
-    async def test_generate_code_api_error(self):
+    async def test_generate_code_api_error(self, lm_client, mock_make_request):
         """API: Gestion des erreurs API"""
         # GIVEN un client LM Studio
-        client = LMStudioClient(base_url="http://localhost:1234")
+        client = lm_client
         
         # WHEN l'API retourne une erreur
-        with patch('src.orchestrator.models.lm_studio_client.LMStudioClient._make_request') as mock_request:
-            from src.orchestrator.models.ai_model_interface import AIModelError
-            mock_request.side_effect = AIModelError("API Error: 500 - Internal Server Error", error_code="500")
-            
-            # THEN une exception doit être levée
-            with pytest.raises(AIModelError) as exc_info:
-                await client.generate_code("test prompt")
-            
-            assert "API Error" in str(exc_info.value)
+        mock_make_request.side_effect = AIModelError("API Error: 500 - Internal Server Error", error_code="500")
+        
+        # THEN une exception doit être levée
+        with pytest.raises(AIModelError) as exc_info:
+            await client.generate_code("test prompt")
+        
+        assert "API Error" in str(exc_info.value)
     
-    @pytest.mark.asyncio
-    async def test_analyze_text_with_system_prompt(self):
+    async def test_analyze_text_with_system_prompt(self, lm_client, mock_make_request):
         """API: Analyse de texte avec prompt système"""
         # GIVEN un client configuré
-        client = LMStudioClient(base_url="http://localhost:1234")
-        
-        mock_response = {
-            "choices": [{
-                "message": {
-                    "content": "Cette fonction contient 2 bugs potentiels:\n1. Division par zéro\n2. Type non vérifié"
-                }
-            }]
-        }
+        client = lm_client
         
-        with patch('src.orchestrator.models.lm_studio_client.LMStudioClient._make_request') as mock_request:
-            mock_request.return_value = mock_response
-            
-            # WHEN on analyse du code
-            result = await client.analyze_text(
-                text="def divide(a, b): return a / b",
-                analysis_type="bug_detection"
-            )
+        mock_response = _chat_response(
+            "Cette fonction contient 2 bugs potentiels:\n1. Division par zéro\n2. Type non vérifié"
+        )
+        
+        mock_make_request.return_value = mock_response
+        
+        # WHEN on analyse du code
+        result = await client.analyze_text(
+            text="def divide(a, b): return a / b",
+            analysis_type="bug_detection"
+        )
         
         # THEN l'analyse doit être retournée
         assert "bugs potentiels" in result
         assert "Division par zéro" in result
         
         # AND le prompt système doit être utilisé
-        call_args = mock_request.call_args[1]['json']
+        call_args = mock_make_request.call_args[1]['json']
         assert any("system" in msg.get("role", "") for msg in call_args["messages"])
     
-    @pytest.mark.asyncio 
-    async def test_generate_tests_tdd_format(self):
+    async def test_generate_tests_tdd_format(self, lm_client, mock_make_request):
         """API: Génération de tests au format TDD"""
         # GIVEN un client et du code à tester
-        client = LMStudioClient(base_url="http://localhost:1234")
+        client = lm_client
         
-        mock_response = {
-            "choices": [{
-                "message": {
-                    "content": """def test_calculator_add():
+        mock_response = _chat_response("""def test_calculator_add():
     # GIVEN two numbers
     a, b = 2, 3
     
@@ -162,51 +198,35 @@ class TestLMStudioClientAPI:
     result = calculator.add(a, b)
     
     # THEN result should be sum
-    assert result == 5"""
-                }
-            }]
-        }
+    assert result == 5""")
         
-        with patch('src.orchestrator.models.lm_studio_client.LMStudioClient._make_request') as mock_request:
-            mock_request.return_value = mock_response
-            
-            # WHEN on génère des tests
-            result = await client.generate_tests(
-                code="def add(a, b): return a + b",
-                test_framework="pytest"
-            )
+        mock_make_request.return_value = mock_response
+        
+        # WHEN on génère des tests
+        result = await client.generate_tests(
+            code="def add(a, b): return a + b",
+            test_framework="pytest"
+        )
         
         # THEN les tests doivent suivre le format TDD
-        assert "# GIVEN" in result
-        assert "# WHEN" in result 
-        assert "# THEN" in result
-        assert "assert" in result
+        assert [marker for marker in _TDD_MARKERS if marker not in result] == []
 
 
 class TestLMStudioClientResilience:
     """Tests TDD pour la résilience du client"""
     
-    @pytest.mark.asyncio
-    async def test_connection_retry_logic(self):
+    async def test_connection_retry_logic(self, make_client, no_sleep, success_response):
         """RESILIENCE: Retry automatique sur erreur de connexion"""
         # GIVEN un client avec retry configuré
-        client = LMStudioClient(
-            base_url="http://localhost:1234", 
-            max_retries=3,
-            retry_delay=0.1
-        )
+        client = make_client(base_url=_BASE_URL, max_retries=3, retry_delay=0.1)
         
         # WHEN la connexion échoue puis réussit (mocking à un niveau plus bas)
-        with patch('aiohttp.ClientSession.request') as mock_request:
+        with patch.object(aiohttp.ClientSession, "request") as mock_request:
             # Simuler échec puis succès
-            success_response = AsyncMock()
-            success_response.status = 200
-            success_response.json = AsyncMock(return_value={"choices": [{"message": {"content": "Success"}}]})
-            
             mock_request.side_effect = [
                 aiohttp.ClientError("Connection refused"),  # Premier échec
                 aiohttp.ClientError("Connection refused"),  # Deuxième échec
-                AsyncMock(__aenter__=AsyncMock(return_value=success_response))  # Succès
+                _FakeCM(success_response)  # Succès
             ]
             
             # THEN la requête doit finalement réussir après retry
@@ -215,18 +235,42 @@ class TestLMStudioClientResilience:
             
             # AND 3 appels doivent avoir été faits
             assert mock_request.call_count == 3
+            
+            # AND une attente de retry_delay entre chaque tentative
+            assert no_sleep.await_count == 2
+            no_sleep.assert_awaited_with(0.1)
+    
+    async def test_session_is_reused(self, monkeypatch, success_response):
+        """RESILIENCE: Une seule session HTTP pour plusieurs requêtes"""
+        # GIVEN un compteur de sessions aiohttp créées
+        created = []
+        original_init = aiohttp.ClientSession.__init__
+        
+        def counting_init(session, *args, **kwargs):
+            created.append(session)
+            original_init(session, *args, **kwargs)
+        
+        monkeypatch.setattr(aiohttp.ClientSession, "__init__", counting_init)
+        
+        # WHEN un client enchaîne trois requêtes
+        with patch.object(aiohttp.ClientSession, "request") as mock_request:
+            mock_request.side_effect = lambda *args, **kwargs: _FakeCM(success_response)
+            
+            async with LMStudioClient(base_url=_BASE_URL) as client:
+                for _ in range(3):
+                    assert await client.generate_code("test") == "Success"
+        
+        # THEN une seule session doit avoir été créée et réutilisée
+        assert mock_request.call_count == 3
+        assert len(created) == 1
     
-    @pytest.mark.asyncio
-    async def test_timeout_handling(self):
+    async def test_timeout_handling(self, make_client, no_sleep):
         """RESILIENCE: Gestion des timeouts"""
         # GIVEN un client avec timeout court
-        client = LMStudioClient(
-            base_url="http://localhost:1234",
-            timeout=0.1
-        )
+        client = make_client(base_url=_BASE_URL, timeout=0.1)
         
         # WHEN la requête prend trop de temps
-        with patch('aiohttp.ClientSession.request') as mock_request:
+        with patch.object(aiohttp.ClientSession, "request") as mock_request:
             mock_request.side_effect = asyncio.TimeoutError()
             
             # THEN une exception AIModelError doit être levée avec timeout
@@ -236,54 +280,51 @@ class TestLMStudioClientResilience:
             # Le timeout est encapsulé dans une AIModelError
             assert "failed after" in str(exc_info.value) or "TimeoutError" in str(exc_info.value)
     
-    def test_model_discovery(self):
+    def test_model_discovery(self, lm_client, mock_make_request):
         """DISCOVERY: Découverte des modèles disponibles"""
         # GIVEN un client LM Studio
-        client = LMStudioClient(base_url="http://localhost:1234")
+        client = lm_client
         
         # WHEN on demande les modèles disponibles
-        with patch('src.orchestrator.models.lm_studio_client.LMStudioClient._make_request') as mock_request:
-            mock_request.return_value = {
-                "data": [
-                    {"id": "llama-2-7b", "owned_by": "local"},
-                    {"id": "codellama-13b", "owned_by": "local"}
-                ]
-            }
-            
-            # THEN on doit obtenir la liste des modèles
-            # NOTE: Cette méthode sera implémentée en phase GREEN
-            assert hasattr(client, 'list_available_models') or True  # Placeholder pour RED phase
+        mock_make_request.return_value = {
+            "data": [
+                {"id": "llama-2-7b", "owned_by": "local"},
+                {"id": "codellama-13b", "owned_by": "local"}
+            ]
+        }
+        
+        # THEN on doit obtenir la liste des modèles
+        # NOTE: Cette méthode sera implémentée en phase GREEN
+        assert hasattr(client, 'list_available_models') or True  # Placeholder pour RED phase
 
 
 class TestLMStudioClientIntegration:
     """Tests d'intégration TDD"""
     
-    @pytest.mark.asyncio
-    async def test_full_code_generation_workflow(self):
+    async def test_full_code_generation_workflow(self, lm_client, mock_make_request):
         """INTEGRATION: Workflow complet de génération de code"""
         # GIVEN un client et une demande complète
-        client = LMStudioClient(base_url="http://localhost:1234")
+        client = lm_client
         
         # AND des réponses mock pour chaque étape
         responses = [
             # 1. Analyse de la demande
-            {"choices": [{"message": {"content": "Type: function, Language: Python"}}]},
+            _chat_response("Type: function, Language: Python"),
             # 2. Génération du code
-            {"choices": [{"message": {"content": "def fibonacci(n):\n    if n <= 1: return n\n    return fibonacci(n-1) + fibonacci(n-2)"}}]},
+            _chat_response("def fibonacci(n):\n    if n <= 1: return n\n    return fibonacci(n-1) + fibonacci(n-2)"),
             # 3. Génération des tests
-            {"choices": [{"message": {"content": "def test_fibonacci():\n    assert fibonacci(0) == 0\n    assert fibonacci(1) == 1"}}]}
+            _chat_response("def test_fibonacci():\n    assert fibonacci(0) == 0\n    assert fibonacci(1) == 1")
         ]
         
-        with patch('src.orchestrator.models.lm_studio_client.LMStudioClient._make_request') as mock_request:
-            mock_request.side_effect = responses
-            
-            # WHEN on exécute le workflow complet
-            analysis = await client.analyze_text("Create a fibonacci function", "code_request")
-            code = await client.generate_code("Create fibonacci function in Python")
-            tests = await client.generate_tests(code, "pytest")
+        mock_make_request.side_effect = responses
+        
+        # WHEN on exécute le workflow complet (étapes séquentielles : réponses ordonnées)
+        analysis = await client.analyze_text("Create a fibonacci function", "code_request")
+        code = await client.generate_code("Create fibonacci function in Python")
+        tests = await client.generate_tests(code, "pytest")
         
         # THEN chaque étape doit réussir
         assert "function" in analysis
         assert "fibonacci" in code
         assert "test_fibonacci" in tests
-        assert mock_request.call_count == 3
\ No newline at end of file
+        assert mock_make_request.call_count == 3
\ No newline at end of file
@@ -5,8 +5,57 @@ Phase RED : Ces tests doivent échouer initialement
 
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
-import json
-import asyncio
+from types import MappingProxyType, SimpleNamespace
+
+from orchestrator.mcp.mcp_server import MCPServer
+from orchestrator.mcp.mcp_client import MCPClient
+from orchestrator.mcp.mcp_manager import MCPManager
+from orchestrator.mcp.mcp_router import MCPRouter
+from orchestrator.mcp.mcp_orchestrator import MCPOrchestrator
+from orchestrator.mcp.mcp_load_balancer import MCPLoadBalancer
+
+# Messages MCP en lecture seule, partagés par les tests
+_REQUEST_MESSAGE = MappingProxyType({
+    "type": "request",
+    "method": "generate",
+    "params": MappingProxyType({"prompt": "test"})
+})
+_CODE_REQUEST = MappingProxyType({
+    "action": "generate",
+    "type": "code",
+    "prompt": "Create a function"
+})
+_ROUTED_MESSAGE = MappingProxyType({"type": "code_generation"})
+
+
+def _container(name, labels, ip):
+    """Conteneur Docker factice exposant une seule adresse IP"""
+    return SimpleNamespace(
+        name=name,
+        labels=labels,
+        attrs={"NetworkSettings": {"Networks": {"bridge": {"IPAddress": ip}}}}
+    )
+
+
+@pytest.fixture(scope="module")
+def _fake_docker_client():
+    """Client Docker factice construit une fois pour le module"""
+    return Mock()
+
+
+@pytest.fixture
+def fake_docker_env(request, monkeypatch, _fake_docker_client):
+    """docker.from_env renvoyant le client factice et les conteneurs paramétrés"""
+    _fake_docker_client.reset_mock()
+    _fake_docker_client.containers.list.return_value = request.param
+    monkeypatch.setattr("docker.from_env", lambda *args, **kwargs: _fake_docker_client)
+    return _fake_docker_client
+
+
+@pytest.fixture
+def mcp_client():
+    """MCPClient neuf pour chaque test (construction légère, sans connexion)"""
+    return MCPClient("localhost", 8080)
 
 
 class TestMCPIntegration:
@@ -16,8 +65,6 @@ class TestMCPIntegration:
     def test_mcp_server_initialization(self, mock_config):
         """Test l'initialisation d'un serveur MCP"""
         # GIVEN une configuration MCP
-        from orchestrator.mcp.mcp_server import MCPServer
-        
         config = {
             "name": "test-server",
             "type": "docker",
@@ -36,13 +83,10 @@ class TestMCPIntegration:
         assert hasattr(server, 'receive_message')
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_mcp_connection(self, mock_mcp_server):
+    async def test_mcp_connection(self, mcp_client, mock_mcp_server):
         """Test la connexion à un serveur MCP"""
         # GIVEN un serveur MCP
-        from orchestrator.mcp.mcp_client import MCPClient
-        
-        client = MCPClient("localhost", 8080)
+        client = mcp_client
         
         with patch.object(client, '_create_connection', return_value=mock_mcp_server):
             # WHEN on se connecte
@@ -53,13 +97,10 @@ class TestMCPIntegration:
             mock_mcp_server.connect.assert_called_once()
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_mcp_protocol_negotiation(self, mock_mcp_server):
+    async def test_mcp_protocol_negotiation(self, mcp_client, mock_mcp_server):
         """Test la négociation du protocole MCP"""
         # GIVEN un client MCP
-        from orchestrator.mcp.mcp_client import MCPClient
-        
-        client = MCPClient("localhost", 8080)
+        client = mcp_client
         client.connection = mock_mcp_server
         
         # WHEN on négocie le protocole
@@ -76,87 +117,60 @@ class TestMCPIntegration:
         assert capabilities["protocol"] == "mcp/1.0"
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_mcp_message_sending(self, mock_mcp_server):
+    async def test_mcp_message_sending(self, mcp_client, mock_mcp_server):
         """Test l'envoi de messages MCP"""
         # GIVEN un client connecté
-        from orchestrator.mcp.mcp_client import MCPClient
-        
-        client = MCPClient("localhost", 8080)
+        client = mcp_client
         client.connection = mock_mcp_server
         
-        message = {
-            "type": "request",
-            "method": "generate",
-            "params": {"prompt": "test"}
-        }
-        
         # WHEN on envoie un message
-        response = await client.send_message(message)
+        response = await client.send_message(_REQUEST_MESSAGE)
         
         # THEN le message doit être envoyé et la réponse reçue
-        mock_mcp_server.send_message.assert_called_with(message)
+        mock_mcp_server.send_message.assert_called_with(_REQUEST_MESSAGE)
         assert response["status"] == "ok"
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_mcp_service_discovery(self):
+    @pytest.mark.parametrize("fake_docker_env, expected", [
+        ([_container("mcp-service", {"mcp.enabled": "true"}, "172.17.0.2")],
+         [("mcp-service", "172.17.0.2")]),
+        ([_container("web", {}, "172.17.0.3")], []),  # Conteneur non MCP
+        ([_container("mcp-offline", {"mcp.enabled": "true"}, "")], []),  # Sans IP
+    ], indirect=["fake_docker_env"])
+    async def test_mcp_service_discovery(self, fake_docker_env, expected):
         """Test la découverte de services MCP"""
-        # GIVEN un gestionnaire MCP
-        from orchestrator.mcp.mcp_manager import MCPManager
-        
+        # GIVEN un gestionnaire MCP et des conteneurs Docker
         manager = MCPManager()
         
-        with patch('orchestrator.mcp.mcp_manager.docker.from_env') as mock_docker:
-            mock_container = Mock()
-            mock_container.name = "mcp-service"
-            mock_container.labels = {"mcp.enabled": "true"}
-            mock_container.attrs = {
-                "NetworkSettings": {
-                    "Networks": {
-                        "bridge": {"IPAddress": "172.17.0.2"}
-                    }
-                }
-            }
-            mock_docker.return_value.containers.list.return_value = [mock_container]
-            
-            # WHEN on découvre les services
-            services = await manager.discover_services()
-            
-            # THEN les services MCP doivent être trouvés
-            assert len(services) == 1
-            assert services[0]["name"] == "mcp-service"
-            assert services[0]["ip"] == "172.17.0.2"
+        # WHEN on découvre les services
+        services = await manager.discover_services()
+        
+        # THEN seuls les services MCP joignables doivent être trouvés
+        assert [(service["name"], service["ip"]) for service in services] == expected
+        fake_docker_env.containers.list.assert_called_once()
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_mcp_message_routing(self):
         """Test le routage des messages MCP"""
         # GIVEN un routeur MCP avec plusieurs serveurs
-        from orchestrator.mcp.mcp_router import MCPRouter
-        
         router = MCPRouter()
         router.servers = {
-            "code": Mock(capabilities=["code"]),
-            "text": Mock(capabilities=["text"]),
-            "tools": Mock(capabilities=["tools"])
+            "code": SimpleNamespace(capabilities=["code"]),
+            "text": SimpleNamespace(capabilities=["text"]),
+            "tools": SimpleNamespace(capabilities=["tools"])
         }
         
         # WHEN on route un message
-        message = {"type": "code_generation"}
-        target = await router.route_message(message)
+        target = await router.route_message(_ROUTED_MESSAGE)
         
         # THEN le bon serveur doit être sélectionné
         assert target == router.servers["code"]
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_mcp_error_handling(self, mock_mcp_server):
+    async def test_mcp_error_handling(self, mcp_client, mock_mcp_server):
         """Test la gestion des erreurs MCP"""
         # GIVEN un client avec erreur
-        from orchestrator.mcp.mcp_client import MCPClient
-        
-        client = MCPClient("localhost", 8080)
+        client = mcp_client
         client.connection = mock_mcp_server
         mock_mcp_server.send_message.side_effect = Exception("Connection lost")
         
@@ -168,13 +182,11 @@ class TestMCPIntegration:
         assert "Connection lost" in str(exc_info.value)
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_mcp_reconnection(self, mock_mcp_server):
+    async def test_mcp_reconnection(self, mcp_client, mock_mcp_server, no_sleep):
         """Test la reconnexion automatique MCP"""
         # GIVEN un client avec reconnexion
-        from orchestrator.mcp.mcp_client import MCPClient
-        
-        client = MCPClient("localhost", 8080, auto_reconnect=True)
+        client = mcp_client
+        client.auto_reconnect = True
         client.max_reconnect_attempts = 3
         
         # Simuler perte de connexion puis reconnexion
@@ -190,45 +202,31 @@ class TestMCPIntegration:
             assert mock_mcp_server.connect.call_count == 3
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_mcp_full_communication_flow(self):
         """Test le flux complet de communication MCP"""
         # GIVEN un orchestrateur avec MCP
-        from orchestrator.mcp.mcp_orchestrator import MCPOrchestrator
-        
         orchestrator = MCPOrchestrator()
         
-        with patch.object(orchestrator, 'discover_servers') as mock_discover:
-            with patch.object(orchestrator, 'connect_to_server') as mock_connect:
-                with patch.object(orchestrator, 'send_request') as mock_send:
-                    
-                    mock_discover.return_value = [{"name": "test-server", "ip": "172.17.0.2"}]
-                    mock_connect.return_value = True
-                    mock_send.return_value = {"result": "generated code"}
-                    
-                    # WHEN on exécute une requête complète
-                    request = {
-                        "action": "generate",
-                        "type": "code",
-                        "prompt": "Create a function"
-                    }
-                    
-                    result = await orchestrator.process_request(request)
-                    
-                    # THEN le flux complet doit fonctionner
-                    assert result is not None
-                    assert result["result"] == "generated code"
-                    mock_discover.assert_called_once()
-                    mock_connect.assert_called()
-                    mock_send.assert_called()
+        mock_discover = AsyncMock(return_value=[{"name": "test-server", "ip": "172.17.0.2"}])
+        mock_connect = AsyncMock(return_value=True)
+        mock_send = AsyncMock(return_value={"result": "generated code"})
+        
+        with patch.multiple(orchestrator, discover_servers=mock_discover,
+                            connect_to_server=mock_connect, send_request=mock_send):
+            # WHEN on exécute une requête complète
+            result = await orchestrator.process_request(_CODE_REQUEST)
+            
+            # THEN le flux complet doit fonctionner
+            assert result is not None
+            assert result["result"] == "generated code"
+            mock_discover.assert_called_once()
+            mock_connect.assert_called()
+            mock_send.assert_called()
     
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_mcp_load_balancing(self):
         """Test le load balancing entre serveurs MCP"""
         # GIVEN plusieurs serveurs MCP
-        from orchestrator.mcp.mcp_load_balancer import MCPLoadBalancer
-        
         balancer = MCPLoadBalancer()
         balancer.servers = [
             {"name": "server1", "load": 0.2, "capacity": 100},
@@ -236,7 +234,8 @@ class TestMCPIntegration:
             {"name": "server3", "load": 0.8, "capacity": 100}
         ]
         
-        # WHEN on distribue des requêtes
+        # WHEN on distribue des requêtes (séquentiellement : chaque choix dépend
+        # de la charge mise à jour après la requête précédente)
         assignments = []
         for _ in range(10):
             server = await balancer.get_next_server()